@@ -1,3 +1,4 @@
+# pylint: disable=too-many-lines
 """
 Amazon Redshift connector implementation using the Redshift Data API.
 
@@ -5,8 +6,15 @@ This connector enables reading data from Amazon Redshift clusters and serverless
 workgroups using the AWS Redshift Data API (REST-based, asynchronous execution model).
 """
 
+import asyncio
+import contextlib
+import queue
+import random
+import threading
 import time
-from typing import Dict, List, Iterator, Any, Optional
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Iterator, Any, Optional
 
 # NOTE: boto3 and botocore imports are moved inside methods to avoid
 # serialization issues when Spark distributes the DataSource to workers.
@@ -25,9 +33,316 @@ from pyspark.sql.types import (
     TimestampType,
     DecimalType,
     BinaryType,
+    DataType,
 )
 
 
+# How long a table confirmed to exist (and a cached metadata statement result)
+# stays valid before the Data API is asked again.
+_TABLE_CACHE_TTL_SECONDS = 60
+
+# Statement polling starts with a short delay so that fast metadata queries
+# return almost immediately, then backs off exponentially up to poll_interval.
+_INITIAL_POLL_DELAY_SECONDS = 0.05
+_POLL_BACKOFF_FACTOR = 1.7
+
+# Thread pool size for fanning out per-table metadata fetches
+_MAX_WORKERS = 16
+
+# Concurrent DescribeTable calls in get_many_table_schemas_async. With calls
+# taking 50 ms or more, this stays under the Data API quota of 200 requests
+# per second; adaptive retries absorb any throttling from other callers.
+_MAX_ASYNC_CONCURRENCY = 10
+
+# Result pages fetched ahead of the consumer in read_table (double buffering)
+_PREFETCH_PAGES = 2
+
+# Shared DataType instances for the parameterless Spark types
+_STRING = StringType()
+_LONG = LongType()
+_FLOAT = FloatType()
+_DOUBLE = DoubleType()
+_BOOLEAN = BooleanType()
+_DATE = DateType()
+_TIMESTAMP = TimestampType()
+_BINARY = BinaryType()
+
+
+def _string_type(precision, scale, char_max_length):
+    """Type factory for types mapped to StringType."""
+    return _STRING
+
+
+def _decimal_type(precision, scale, char_max_length):
+    """Type factory for DECIMAL/NUMERIC, using the provided precision/scale or defaults."""
+    return DecimalType(
+        precision if precision is not None else 18,
+        scale if scale is not None else 0,
+    )
+
+
+def _constant_type(data_type):
+    """Build a type factory that always returns the given DataType instance."""
+    return lambda precision, scale, char_max_length: data_type
+
+
+# Redshift type name (lowercase) -> factory taking (precision, scale,
+# char_max_length) and returning the Spark DataType. Unknown types map to
+# StringType for safety.
+_TYPE_MAP: Dict[str, Callable[[Optional[int], Optional[int], Optional[int]], DataType]] = {
+    # Integer types - prefer LongType to avoid overflow
+    "smallint": _constant_type(_LONG),
+    "int2": _constant_type(_LONG),
+    "integer": _constant_type(_LONG),
+    "int": _constant_type(_LONG),
+    "int4": _constant_type(_LONG),
+    "bigint": _constant_type(_LONG),
+    "int8": _constant_type(_LONG),
+    # Decimal/numeric types
+    "numeric": _decimal_type,
+    "decimal": _decimal_type,
+    # Floating point types
+    "real": _constant_type(_FLOAT),
+    "float4": _constant_type(_FLOAT),
+    "double precision": _constant_type(_DOUBLE),
+    "float8": _constant_type(_DOUBLE),
+    "float": _constant_type(_DOUBLE),
+    # Boolean type
+    "boolean": _constant_type(_BOOLEAN),
+    "bool": _constant_type(_BOOLEAN),
+    # String types
+    "character": _string_type,
+    "char": _string_type,
+    "bpchar": _string_type,
+    "character varying": _string_type,
+    "varchar": _string_type,
+    "text": _string_type,
+    # Date/time types
+    "date": _constant_type(_DATE),
+    "timestamp": _constant_type(_TIMESTAMP),
+    "timestamp without time zone": _constant_type(_TIMESTAMP),
+    "timestamptz": _constant_type(_TIMESTAMP),
+    "timestamp with time zone": _constant_type(_TIMESTAMP),
+    # Time types without date component - map to String
+    "time": _string_type,
+    "time without time zone": _string_type,
+    "timetz": _string_type,
+    "time with time zone": _string_type,
+    "interval": _string_type,
+    # Binary type
+    "varbyte": _constant_type(_BINARY),
+    # Special Redshift types: semi-structured (super), spatial
+    # (geometry/geography) and HyperLogLog sketch
+    "super": _string_type,
+    "geometry": _string_type,
+    "geography": _string_type,
+    "hllsketch": _string_type,
+}
+
+# Primary key lookup, parameterized on schema (:s) and table (:t) so the SQL
+# text is identical across tables and Redshift can reuse the compiled plan
+_PRIMARY_KEYS_SQL = """
+    SELECT
+        kcu.column_name,
+        kcu.ordinal_position
+    FROM information_schema.table_constraints tc
+    JOIN information_schema.key_column_usage kcu
+        ON tc.constraint_name = kcu.constraint_name
+        AND tc.table_schema = kcu.table_schema
+        AND tc.table_name = kcu.table_name
+    WHERE tc.constraint_type = 'PRIMARY KEY'
+        AND tc.table_schema = :s
+        AND tc.table_name = :t
+    ORDER BY kcu.ordinal_position
+"""
+
+# Memoized results of _map_redshift_type_to_spark, keyed by its arguments.
+# A plain dict (unlike an lru_cache wrapper) pickles by value with the module.
+_SPARK_TYPE_CACHE_MAX_ENTRIES = 512
+_SPARK_TYPE_CACHE: Dict[tuple, DataType] = {}
+
+
+def _map_redshift_type_to_spark(
+    redshift_type: str,
+    precision: Optional[int] = None,
+    scale: Optional[int] = None,
+    char_max_length: Optional[int] = None,
+) -> DataType:
+    """
+    Map Redshift data type to Spark data type.
+    
+    Results are memoized in _SPARK_TYPE_CACHE, so every column with the same
+    type signature shares one DataType instance (including DecimalType for a
+    given precision/scale).
+    
+    Args:
+        redshift_type: Redshift type name (e.g., 'integer', 'varchar', 'numeric')
+        precision: Numeric precision (for DECIMAL/NUMERIC types)
+        scale: Numeric scale (for DECIMAL/NUMERIC types)
+        char_max_length: Maximum character length (for CHAR/VARCHAR types)
+        
+    Returns:
+        Spark DataType instance
+    """
+    key = (redshift_type, precision, scale, char_max_length)
+    spark_type = _SPARK_TYPE_CACHE.get(key)
+    if spark_type is None:
+        type_factory = _TYPE_MAP.get(redshift_type.lower(), _string_type)
+        spark_type = type_factory(precision, scale, char_max_length)
+        if len(_SPARK_TYPE_CACHE) < _SPARK_TYPE_CACHE_MAX_ENTRIES:
+            _SPARK_TYPE_CACHE[key] = spark_type
+    return spark_type
+
+
+# Table types returned by ListTables that the connector exposes, and schemas
+# that are never listed
+_LISTED_TABLE_TYPES = frozenset({"TABLE", "VIEW"})
+_SYSTEM_SCHEMAS = frozenset({"pg_catalog", "information_schema", "pg_internal"})
+
+# Typed value key used by the Data API for each result column type name
+# (ColumnMetadata.typeName). Types not listed are returned as stringValue.
+_FIELD_VALUE_KEYS = {
+    "int2": "longValue",
+    "int4": "longValue",
+    "int8": "longValue",
+    "oid": "longValue",
+    "float4": "doubleValue",
+    "float8": "doubleValue",
+    "bool": "booleanValue",
+    "varbyte": "blobValue",
+}
+
+
+class _ProcessCache:
+    """
+    Cache shared by all connector instances in one process.
+    
+    When the connector is defined in a notebook or pipeline module, Spark
+    pickles it by value together with the module globals its methods use.
+    A _ProcessCache pickles as a new, empty cache, so neither its lock nor
+    any driver-side entries are shipped to workers.
+    """
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.entries: Dict[tuple, Any] = {}
+
+    def __reduce__(self):
+        return (self.__class__, ())
+
+
+class _ClientCache(_ProcessCache):
+    """_ProcessCache of boto3 clients that also holds the boto3 session creating them."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.session = None
+
+
+# boto3 session and clients shared by all connector instances in the process,
+# keyed by (service name, client kwargs). Reusing clients avoids repeated
+# service model loading and keeps HTTPS connections alive between instances.
+_CLIENTS = _ClientCache()
+
+# Metadata statement results shared by all connector instances in the
+# process, keyed by (sql, parameters, connection target, AWS identity).
+# Identical queries issued back to back by different tasks then hit the
+# Data API once.
+_STATEMENT_CACHE_MAX_ENTRIES = 32
+_STATEMENT_CACHE = _ProcessCache()
+
+
+def _orjson_response_parser_factory() -> Any:
+    """
+    Return a botocore response parser factory that decodes JSON protocol
+    bodies (which the Data API uses) with orjson, or None when orjson is
+    not installed so the stdlib parser stays in place.
+
+    botocore is imported here (not at module level) to avoid serialization
+    issues when Spark distributes the DataSource to workers.
+    """
+    try:
+        import orjson
+    except ImportError:
+        return None
+    import json
+    from botocore.parsers import JSONParser, ResponseParserFactory
+
+    class _OrjsonJSONParser(JSONParser):
+        def _parse_body_as_json(self, body_contents):
+            if not body_contents:
+                return {}
+            try:
+                return orjson.loads(body_contents)
+            except orjson.JSONDecodeError:
+                pass
+            # orjson is stricter than the stdlib (e.g. it rejects NaN), so a
+            # body it refuses may still be valid for botocore's own parser
+            body = body_contents.decode(self.DEFAULT_ENCODING)
+            try:
+                return json.loads(body)
+            except ValueError:
+                # Same fallback as botocore: surface the raw body as the message
+                return {"message": body}
+
+    class _OrjsonResponseParserFactory(ResponseParserFactory):
+        def create_parser(self, protocol_name):
+            if protocol_name == "json":
+                return _OrjsonJSONParser(**self._defaults)
+            return super().create_parser(protocol_name)
+
+    return _OrjsonResponseParserFactory()
+
+
+def _client_config() -> Any:
+    """
+    Build the botocore Config shared by the sync and async Data API clients.
+    
+    botocore is imported here (not at module level) to avoid serialization
+    issues when Spark distributes the DataSource to workers.
+    """
+    from botocore.config import Config
+
+    # A larger pool lets concurrent metadata fetches share the client;
+    # adaptive retries back off when the Data API throttles
+    return Config(
+        max_pool_connections=50,
+        retries={"max_attempts": 10, "mode": "adaptive"},
+    )
+
+
+def _get_shared_client(service_name: str, client_kwargs: Dict[str, str]) -> Any:
+    """
+    Return the cached boto3 client for a service and set of client kwargs,
+    creating it on first use.
+    
+    boto3 is imported here (not at module level) to avoid serialization
+    issues when Spark distributes the DataSource to workers.
+    """
+    key = (service_name, frozenset(client_kwargs.items()))
+    with _CLIENTS.lock:
+        client = _CLIENTS.entries.get(key)
+        if client is None:
+            import boto3  # Import here to avoid serialization issues
+            import botocore.session
+
+            if _CLIENTS.session is None:
+                # GetStatementResult pages hold one dict per cell, so JSON
+                # decoding dominates client CPU on large reads
+                botocore_session = botocore.session.get_session()
+                parser_factory = _orjson_response_parser_factory()
+                if parser_factory is not None:
+                    botocore_session.register_component(
+                        "response_parser_factory", parser_factory
+                    )
+                _CLIENTS.session = boto3.session.Session(botocore_session=botocore_session)
+            client = _CLIENTS.session.client(
+                service_name, config=_client_config(), **client_kwargs
+            )
+            _CLIENTS.entries[key] = client
+    return client
+
+
 class LakeflowConnect:
     """
     Redshift connector using AWS Redshift Data API.
@@ -35,6 +350,9 @@ class LakeflowConnect:
     Supports both provisioned clusters and serverless workgroups.
     """
 
+    # Typed value keys a Data API field may carry
+    _VALUE_KEYS = ("stringValue", "longValue", "doubleValue", "booleanValue", "blobValue")
+
     def __init__(self, options: Dict[str, str]) -> None:
         """
         Initialize the Redshift connector with AWS credentials and cluster/workgroup details.
@@ -50,8 +368,13 @@ class LakeflowConnect:
             - db_user (optional): Database user for cluster (uses IAM if omitted)
             - secret_arn (optional): ARN of AWS Secrets Manager secret containing credentials
             - schema_filter (optional): Comma-separated list of schemas to include (default: all except system)
-            - poll_interval (optional): Seconds between statement status polls (default: 2)
-            - max_poll_attempts (optional): Maximum polling attempts (default: 300, ~10 minutes)
+            - poll_interval (optional): Maximum seconds between statement status polls (default: 2)
+            - max_poll_attempts (optional): Polling budget in units of poll_interval
+              (default: 300, ~10 minutes)
+            - unload_s3_prefix (optional): S3 URI (e.g. 's3://bucket/prefix') to UNLOAD
+              full table reads to as Parquet instead of paging through the Data API
+            - unload_iam_role (optional): ARN of the IAM role Redshift assumes to write
+              to unload_s3_prefix (required together with unload_s3_prefix)
         """
         self.options = options
 
@@ -81,9 +404,25 @@ class LakeflowConnect:
         self.db_user = options.get("db_user")
         self.secret_arn = options.get("secret_arn")
         self.schema_filter = self._parse_schema_filter(options.get("schema_filter", ""))
-        self.poll_interval = int(options.get("poll_interval", "2"))
+        self.poll_interval = float(options.get("poll_interval", "2"))
         self.max_poll_attempts = int(options.get("max_poll_attempts", "300"))
 
+        # Bulk export of full table reads via UNLOAD to S3 (optional)
+        self.unload_s3_prefix = options.get("unload_s3_prefix")
+        self.unload_iam_role = options.get("unload_iam_role")
+        if bool(self.unload_s3_prefix) != bool(self.unload_iam_role):
+            raise ValueError(
+                "Redshift connector requires both 'unload_s3_prefix' and 'unload_iam_role' "
+                "to enable UNLOAD reads"
+            )
+        if self.unload_s3_prefix and not self.unload_s3_prefix.startswith("s3://"):
+            raise ValueError("Redshift connector requires 'unload_s3_prefix' to be an s3:// URI")
+
+        # Tables confirmed to exist, memoized on the instance and keyed by
+        # (schema, table) with the time they were checked, so the public
+        # methods don't each re-probe the same table
+        self._verified_tables: Dict[tuple[str, str], float] = {}
+
         # Store client configuration for lazy initialization
         # We don't create the boto3 client here because it contains thread locks
         # that cannot be pickled/serialized by Spark
@@ -102,14 +441,13 @@ class LakeflowConnect:
 
     @property
     def client(self):
-        """Lazily initialize the boto3 client on first access.
+        """Lazily look up the boto3 client on first access.
         
-        boto3 is imported here (not at module level) to avoid serialization
-        issues when Spark distributes the DataSource to workers.
+        The client comes from a process-wide cache, so instances with the same
+        region and credentials share one client and its connection pool.
         """
         if self._client is None:
-            import boto3  # Import here to avoid serialization issues
-            self._client = boto3.client("redshift-data", **self._client_kwargs)
+            self._client = _get_shared_client("redshift-data", self._client_kwargs)
         return self._client
 
     def __getstate__(self):
@@ -130,22 +468,39 @@ class LakeflowConnect:
             return None
         return [s.strip() for s in schema_filter.split(",") if s.strip()]
 
-    def _execute_sql(self, sql: str) -> str:
+    def _execute_sql(self, sql: str, parameters: Optional[List[Dict[str, str]]] = None) -> str:
         """
         Execute a SQL statement asynchronously and return the statement ID.
         
         Args:
             sql: SQL statement to execute
+            parameters: Optional named parameters ({"name": ..., "value": ...})
+                bound to the :name markers in the SQL
             
         Returns:
             Statement ID for tracking execution
         """
         from botocore.exceptions import ClientError  # Import here to avoid serialization issues
         
-        params = {
-            "Database": self.database,
-            "Sql": sql,
-        }
+        params = self._connection_params()
+        params["Sql"] = sql
+        if parameters:
+            params["Parameters"] = parameters
+        
+        try:
+            response = self.client.execute_statement(**params)
+            return response["Id"]
+        except ClientError as e:
+            raise RuntimeError(f"Failed to execute SQL statement: {e}") from e
+
+    def _connection_params(self) -> Dict[str, Any]:
+        """
+        Build the connection parameters shared by all Data API calls.
+        
+        Returns:
+            Dictionary with database, cluster/workgroup and credential parameters
+        """
+        params = {"Database": self.database}
         
         # Add cluster or workgroup
         if self.cluster_identifier:
@@ -159,16 +514,16 @@ class LakeflowConnect:
         if self.secret_arn:
             params["SecretArn"] = self.secret_arn
         
-        try:
-            response = self.client.execute_statement(**params)
-            return response["Id"]
-        except ClientError as e:
-            raise RuntimeError(f"Failed to execute SQL statement: {e}") from e
+        return params
 
     def _wait_for_statement(self, statement_id: str) -> Dict[str, Any]:
         """
         Poll statement status until completion (FINISHED, FAILED, or ABORTED).
         
+        Polls back off exponentially (with jitter) from a short initial delay up
+        to poll_interval. The overall timeout is a wall-clock budget of
+        max_poll_attempts * poll_interval seconds.
+        
         Args:
             statement_id: Statement ID to poll
             
@@ -180,7 +535,11 @@ class LakeflowConnect:
         """
         from botocore.exceptions import ClientError  # Import here to avoid serialization issues
         
-        for attempt in range(self.max_poll_attempts):
+        timeout = self.max_poll_attempts * self.poll_interval
+        deadline = time.monotonic() + timeout
+        delay = min(_INITIAL_POLL_DELAY_SECONDS, self.poll_interval)
+        
+        while True:
             try:
                 response = self.client.describe_statement(Id=statement_id)
                 status = response["Status"]
@@ -193,15 +552,14 @@ class LakeflowConnect:
                 elif status == "ABORTED":
                     raise RuntimeError("SQL statement was aborted")
                 
-                # Status is SUBMITTED, PICKED, or STARTED - continue polling
-                time.sleep(self.poll_interval)
-                
             except ClientError as e:
                 raise RuntimeError(f"Failed to describe statement: {e}") from e
-        
-        raise RuntimeError(
-            f"Statement timed out after {self.max_poll_attempts} polling attempts"
-        )
+            
+            # Status is SUBMITTED, PICKED, or STARTED - continue polling
+            if time.monotonic() >= deadline:
+                raise RuntimeError(f"Statement timed out after {timeout:g} seconds of polling")
+            time.sleep(delay + random.uniform(0, delay * 0.1))
+            delay = min(delay * _POLL_BACKOFF_FACTOR, self.poll_interval)
 
     def _get_statement_results(self, statement_id: str) -> List[List[Dict[str, Any]]]:
         """
@@ -236,20 +594,173 @@ class LakeflowConnect:
         
         return records
 
-    def _execute_and_fetch(self, sql: str) -> List[List[Dict[str, Any]]]:
+    def _prefetch_result_pages(
+        self, statement_id: str, next_token: str, pages: queue.Queue, stop: threading.Event
+    ) -> None:
+        """
+        Fetch result pages of a completed statement into a bounded queue.
+        
+        Runs on a background thread, starting from next_token. Each page's
+        records are put on the queue, followed by None once the last page is
+        fetched. A failure is put on the queue as an exception for the consumer
+        to raise.
+        
+        Args:
+            statement_id: Statement ID to retrieve results from
+            next_token: Pagination token of the first page to fetch
+            pages: Queue receiving record lists, None, or an exception
+            stop: Event set by the consumer when it stops reading
+        """
+        from botocore.exceptions import ClientError  # Import here to avoid serialization issues
+
+        def put(item: Any) -> bool:
+            while not stop.is_set():
+                try:
+                    pages.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+
+        try:
+            while True:
+                response = self.client.get_statement_result(
+                    Id=statement_id, NextToken=next_token
+                )
+                if not put(response.get("Records", [])):
+                    return
+
+                next_token = response.get("NextToken")
+                if not next_token:
+                    break
+        except ClientError as e:
+            put(RuntimeError(f"Failed to get statement results: {e}"))
+            return
+        except Exception as e:
+            put(e)
+            return
+
+        put(None)
+
+    def _read_via_unload(self, sql: str) -> Iterator[dict]:
+        """
+        Export a query's results to Parquet on S3 with UNLOAD and read them back.
+        
+        Each call unloads to a fresh sub-prefix of unload_s3_prefix. The files
+        are not deleted afterwards; use an S3 lifecycle rule to expire them.
+        
+        Args:
+            sql: SELECT statement to export
+            
+        Returns:
+            Iterator of records as dicts
+        """
+        prefix = f"{self.unload_s3_prefix.rstrip('/')}/{uuid.uuid4().hex}/"
+        escaped_sql = sql.replace("'", "''")
+        unload_sql = (
+            f"UNLOAD ('{escaped_sql}') TO '{prefix}' "
+            f"IAM_ROLE '{self.unload_iam_role}' "
+            "FORMAT AS PARQUET PARALLEL ON MAXFILESIZE 256 MB"
+        )
+
+        statement_id = self._execute_sql(unload_sql)
+        self._wait_for_statement(statement_id)
+
+        def record_generator() -> Iterator[dict]:
+            # pyarrow is imported here, like boto3, to keep the class serializable
+            import pyarrow as pa
+            import pyarrow.compute as pc
+            import pyarrow.dataset as ds
+            from pyarrow.fs import S3FileSystem
+
+            filesystem = S3FileSystem(
+                access_key=self._client_kwargs.get("aws_access_key_id"),
+                secret_key=self._client_kwargs.get("aws_secret_access_key"),
+                session_token=self._client_kwargs.get("aws_session_token"),
+                region=self.region,
+            )
+            try:
+                dataset = ds.dataset(
+                    prefix[len("s3://"):], format="parquet", filesystem=filesystem
+                )
+            except FileNotFoundError:
+                return  # UNLOAD writes no files for an empty result
+
+            # Dates come back as datetime.date; emit ISO strings like the Data API
+            columns = {
+                field.name: (
+                    pc.field(field.name).cast(pa.string())
+                    if pa.types.is_date(field.type)
+                    else pc.field(field.name)
+                )
+                for field in dataset.schema
+            }
+            for batch in dataset.to_batches(columns=columns):
+                yield from batch.to_pylist()
+
+        return record_generator()
+
+    def _execute_and_fetch(
+        self, sql: str, parameters: Optional[List[Dict[str, str]]] = None
+    ) -> List[List[Dict[str, Any]]]:
         """
         Execute SQL and fetch all results (convenience method).
         
         Args:
             sql: SQL statement to execute
+            parameters: Optional named parameters bound to the SQL
             
         Returns:
             List of records
         """
-        statement_id = self._execute_sql(sql)
+        statement_id = self._execute_sql(sql, parameters)
         self._wait_for_statement(statement_id)
         return self._get_statement_results(statement_id)
 
+    def _execute_and_fetch_cached(
+        self, sql: str, parameters: Optional[List[Dict[str, str]]] = None
+    ) -> List[List[Dict[str, Any]]]:
+        """
+        Execute SQL and fetch all results, reusing a result cached by any
+        connector instance in the process within _TABLE_CACHE_TTL_SECONDS.
+        
+        Only for small metadata queries; table reads must not go through
+        this cache.
+        
+        Args:
+            sql: SQL statement to execute
+            parameters: Optional named parameters bound to the SQL
+            
+        Returns:
+            List of records
+        """
+        key = (
+            sql,
+            tuple((p["name"], p["value"]) for p in parameters or ()),
+            self.region,
+            self.cluster_identifier or self.workgroup_name,
+            self.database,
+            self.db_user,
+            self.secret_arn,
+            # Different AWS identities may not see the same results
+            self._client_kwargs.get("aws_access_key_id"),
+            self._client_kwargs.get("aws_session_token"),
+        )
+        entries = _STATEMENT_CACHE.entries
+        with _STATEMENT_CACHE.lock:
+            cached = entries.pop(key, None)
+            if cached is not None and self._is_fresh(cached[0]):
+                entries[key] = cached  # Re-insert as most recently used
+                return cached[1]
+
+        records = self._execute_and_fetch(sql, parameters)
+
+        with _STATEMENT_CACHE.lock:
+            entries[key] = (time.time(), records)
+            while len(entries) > _STATEMENT_CACHE_MAX_ENTRIES:
+                del entries[next(iter(entries))]
+        return records
+
     def list_tables(self) -> List[str]:
         """
         List all tables in the database, optionally filtered by schema.
@@ -257,33 +768,84 @@ class LakeflowConnect:
         Returns table names in format: "schema_name.table_name"
         Excludes system schemas (pg_catalog, information_schema, pg_internal).
         """
-        # Build schema filter clause
-        schema_filter_clause = ""
-        if self.schema_filter:
-            schema_list = ", ".join(f"'{s}'" for s in self.schema_filter)
-            schema_filter_clause = f"AND table_schema IN ({schema_list})"
+        # One listing per filtered schema, or a single listing of all schemas
+        tables = []
+        for schema_pattern in self.schema_filter or [None]:
+            tables.extend(
+                f"{entry['schema']}.{entry['name']}"
+                for entry in self._list_table_entries(schema_pattern)
+            )
+
+        tables.sort()
+        return tables
+
+    def _list_table_entries(
+        self, schema_pattern: Optional[str] = None, table_pattern: Optional[str] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Page through ListTables, yielding the entries the connector exposes.
         
-        sql = f"""
-            SELECT 
-                table_schema,
-                table_name
-            FROM information_schema.tables
-            WHERE table_schema NOT IN ('pg_catalog', 'information_schema', 'pg_internal')
-                AND table_type IN ('BASE TABLE', 'VIEW')
-                {schema_filter_clause}
-            ORDER BY table_schema, table_name
+        Args:
+            schema_pattern: Optional LIKE pattern restricting the schemas listed
+            table_pattern: Optional LIKE pattern restricting the tables listed
+            
+        Yields:
+            ListTables entries (schema, name, type) that pass _is_listed_table
         """
+        from botocore.exceptions import ClientError  # Import here to avoid serialization issues
 
-        records = self._execute_and_fetch(sql)
+        params = self._connection_params()
+        params["ConnectedDatabase"] = self.database
+        if schema_pattern:
+            params["SchemaPattern"] = schema_pattern
+        if table_pattern:
+            params["TablePattern"] = table_pattern
+
+        try:
+            while True:
+                response = self.client.list_tables(**params)
+                for entry in response.get("Tables", []):
+                    if self._is_listed_table(entry):
+                        yield entry
+
+                next_token = response.get("NextToken")
+                if not next_token:
+                    break
+                params["NextToken"] = next_token
+        except ClientError as e:
+            raise RuntimeError(f"Failed to list tables: {e}") from e
+
+    def refresh_tables(self) -> List[str]:
+        """
+        Invalidate cached discovery results and re-list the tables.
         
-        tables = []
-        for record in records:
-            schema = self._extract_value(record[0])
-            table = self._extract_value(record[1])
-            if schema and table:
-                tables.append(f"{schema}.{table}")
+        Returns:
+            Freshly discovered table names in format "schema_name.table_name"
+        """
+        self._verified_tables = {}
+        with _STATEMENT_CACHE.lock:
+            _STATEMENT_CACHE.entries.clear()
+        return self.list_tables()
+
+    def _is_listed_table(self, table: Dict[str, Any]) -> bool:
+        """
+        Check whether a ListTables entry is a user table or view to expose.
         
-        return tables
+        SchemaPattern is a LIKE pattern, so the schema filter is re-checked
+        for an exact match here.
+        """
+        schema = table.get("schema")
+        if not schema or not table.get("name"):
+            return False
+        if table.get("type") not in _LISTED_TABLE_TYPES:
+            return False
+        return self._is_schema_listed(schema)
+
+    def _is_schema_listed(self, schema: str) -> bool:
+        """Check whether a schema is exposed: not a system schema and within schema_filter."""
+        if schema in _SYSTEM_SCHEMAS:
+            return False
+        return not self.schema_filter or schema in self.schema_filter
 
     def _extract_value(self, field_data: Dict[str, Any]) -> Any:
         """
@@ -295,20 +857,34 @@ class LakeflowConnect:
         Returns:
             Extracted value (appropriate Python type) or None
         """
-        if field_data.get("isNull", False):
-            return None
-        elif "booleanValue" in field_data:
-            return field_data["booleanValue"]
-        elif "longValue" in field_data:
-            return field_data["longValue"]
-        elif "doubleValue" in field_data:
-            return field_data["doubleValue"]
-        elif "stringValue" in field_data:
-            return field_data["stringValue"]
-        elif "blobValue" in field_data:
-            return field_data["blobValue"]  # base64 encoded binary
-        else:
-            return None
+        # isNull fields carry no typed value key, so they fall through to None
+        for key in self._VALUE_KEYS:
+            if key in field_data:
+                return field_data[key]  # blobValue is base64 encoded binary
+        return None
+
+    def _make_extractor(self, type_name: str) -> Callable[[Dict[str, Any]], Any]:
+        """
+        Build a value extractor for a result column of the given type.
+        
+        The extractor reads the typed value key expected for the column directly
+        and only falls back to the generic _extract_value for nulls or
+        unexpected keys.
+        
+        Args:
+            type_name: Column type name from the statement's ColumnMetadata
+            
+        Returns:
+            Function mapping a field from the API response to its value
+        """
+        key = _FIELD_VALUE_KEYS.get(type_name, "stringValue")
+        extract_value = self._extract_value
+
+        def extract(field_data: Dict[str, Any]) -> Any:
+            value = field_data.get(key)
+            return value if value is not None else extract_value(field_data)
+
+        return extract
 
     def _parse_table_name(self, table_name: str) -> tuple[str, str]:
         """
@@ -326,164 +902,310 @@ class LakeflowConnect:
         else:
             return "public", parts[0]
 
-    def _map_redshift_type_to_spark(
-        self,
-        redshift_type: str,
-        precision: Optional[int] = None,
-        scale: Optional[int] = None,
-        char_max_length: Optional[int] = None,
-    ) -> Any:
+    def _is_fresh(self, fetched_at: float) -> bool:
+        """Check whether a memoized discovery result is still within the TTL."""
+        return time.time() - fetched_at <= _TABLE_CACHE_TTL_SECONDS
+
+    def _table_exists(self, schema_name: str, table: str) -> bool:
         """
-        Map Redshift data type to Spark data type.
+        Check whether a table exists and is exposed by the connector.
+        
+        Applies the same rule as list_tables (a TABLE or VIEW in an exposed
+        schema), but probes only this table with ListTables schema and table
+        patterns instead of listing every table in the database. Positive
+        results are cached for _TABLE_CACHE_TTL_SECONDS.
         
         Args:
-            redshift_type: Redshift type name (e.g., 'integer', 'varchar', 'numeric')
-            precision: Numeric precision (for DECIMAL/NUMERIC types)
-            scale: Numeric scale (for DECIMAL/NUMERIC types)
-            char_max_length: Maximum character length (for CHAR/VARCHAR types)
+            schema_name: Schema containing the table
+            table: Table name
             
         Returns:
-            Spark DataType instance
-        """
-        # Normalize type name to lowercase
-        redshift_type = redshift_type.lower()
-
-        # Integer types - prefer LongType to avoid overflow
-        if redshift_type in ("smallint", "int2"):
-            return LongType()
-        elif redshift_type in ("integer", "int", "int4"):
-            return LongType()
-        elif redshift_type in ("bigint", "int8"):
-            return LongType()
-
-        # Decimal/numeric types
-        elif redshift_type in ("numeric", "decimal"):
-            # Use provided precision/scale or defaults
-            p = precision if precision is not None else 18
-            s = scale if scale is not None else 0
-            return DecimalType(p, s)
-
-        # Floating point types
-        elif redshift_type in ("real", "float4"):
-            return FloatType()
-        elif redshift_type in ("double precision", "float8", "float"):
-            return DoubleType()
-
-        # Boolean type
-        elif redshift_type in ("boolean", "bool"):
-            return BooleanType()
-
-        # String types
-        elif redshift_type in ("character", "char", "bpchar"):
-            return StringType()
-        elif redshift_type in ("character varying", "varchar"):
-            return StringType()
-        elif redshift_type == "text":
-            return StringType()
-
-        # Date/time types
-        elif redshift_type == "date":
-            return DateType()
-        elif redshift_type in ("timestamp", "timestamp without time zone"):
-            return TimestampType()
-        elif redshift_type in ("timestamptz", "timestamp with time zone"):
-            return TimestampType()
-        elif redshift_type in ("time", "time without time zone", "timetz", "time with time zone"):
-            # Time types without date component - map to String
-            return StringType()
-        elif redshift_type == "interval":
-            return StringType()
-
-        # Binary type
-        elif redshift_type == "varbyte":
-            return BinaryType()
-
-        # Special Redshift types
-        elif redshift_type == "super":
-            # Semi-structured JSON-like data
-            return StringType()
-        elif redshift_type in ("geometry", "geography"):
-            # Spatial types
-            return StringType()
-        elif redshift_type == "hllsketch":
-            # HyperLogLog sketch
-            return StringType()
-
-        # Default fallback
-        else:
-            # Unknown type - default to String for safety
-            return StringType()
+            True if list_tables would include the table
+        """
+        # An empty table name would make the table pattern match every table
+        if not table or not self._is_schema_listed(schema_name):
+            return False
+
+        key = (schema_name, table)
+        verified_at = self._verified_tables.get(key)
+        if verified_at is not None and self._is_fresh(verified_at):
+            return True
+
+        # The patterns are LIKE patterns ("_" matches any character), so
+        # entries are matched exactly here
+        exists = any(
+            entry["schema"] == schema_name and entry["name"] == table
+            for entry in self._list_table_entries(schema_name, table)
+        )
+        if exists:
+            self._verified_tables[key] = time.time()
+        return exists
+
+    def _validate_table(self, schema_name: str, table: str) -> None:
+        """Raise ValueError if the table does not exist or is not exposed."""
+        if not self._table_exists(schema_name, table):
+            raise ValueError(f"Table '{schema_name}.{table}' is not supported or does not exist")
+
+    def _fetch_primary_key_records(self, schema_name: str, table: str) -> list:
+        """
+        Fetch primary key records for a table, validating that it exists.
+        
+        Results are shared through the process-wide statement cache for
+        _TABLE_CACHE_TTL_SECONDS.
+        
+        Args:
+            schema_name: Schema containing the table
+            table: Table name
+            
+        Returns:
+            Primary key records
+        """
+        self._validate_table(schema_name, table)
+        return self._execute_and_fetch_cached(
+            _PRIMARY_KEYS_SQL,
+            [{"name": "s", "value": schema_name}, {"name": "t", "value": table}],
+        )
+
+    def _describe_table_columns(self, schema_name: str, table: str) -> List[Dict[str, Any]]:
+        """
+        Fetch column metadata for a table with the Data API DescribeTable call.
+        
+        DescribeTable answers synchronously, so no statement has to be
+        submitted, polled and paged through.
+        
+        Args:
+            schema_name: Schema containing the table
+            table: Table name
+            
+        Returns:
+            List of column metadata dicts (name, typeName, nullable, length,
+            precision, scale, ...)
+        """
+        params = self._describe_table_params(schema_name, table)
+        columns = []
+        with self._describe_table_errors():
+            while params:
+                response = self.client.describe_table(**params)
+                params = self._add_column_page(params, response, columns)
+        return columns
+
+    def _describe_table_params(self, schema_name: str, table: str) -> Dict[str, Any]:
+        """Build the request parameters for the first DescribeTable page of a table."""
+        params = self._connection_params()
+        params["Schema"] = schema_name
+        params["Table"] = table
+        return params
+
+    def _add_column_page(
+        self, params: Dict[str, Any], response: Dict[str, Any], columns: List[Dict[str, Any]]
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Append a DescribeTable page's columns to columns.
+        
+        Returns:
+            Request parameters for the next page, or None after the last page
+        """
+        columns.extend(response.get("ColumnList", []))
+        next_token = response.get("NextToken")
+        if not next_token:
+            return None
+        return {**params, "NextToken": next_token}
+
+    @contextlib.contextmanager
+    def _describe_table_errors(self) -> Iterator[None]:
+        """Re-raise DescribeTable client errors as RuntimeError."""
+        from botocore.exceptions import ClientError  # Import here to avoid serialization issues
+
+        try:
+            yield
+        except ClientError as e:
+            raise RuntimeError(f"Failed to describe table: {e}") from e
 
     def get_table_schema(
         self, table_name: str, table_options: Dict[str, str]
     ) -> StructType:
         """
-        Fetch the schema of a table by querying information_schema.columns.
+        Fetch the schema of a table with the Data API DescribeTable call.
         
         Args:
             table_name: Table name in format "schema.table" or just "table"
-            table_options: Additional options (currently unused)
+            table_options: Additional options:
+                - columns: Optional comma-separated column subset; the schema is
+                  projected to match the records read_table returns
             
         Returns:
             StructType representing the table schema
         """
-        # Parse table name first to get fully-qualified name
         schema_name, table = self._parse_table_name(table_name)
-        full_table_name = f"{schema_name}.{table}"
         
-        # Validate table exists using fully-qualified name
-        available_tables = self.list_tables()
-        if full_table_name not in available_tables:
+        # Only tables list_tables exposes have a schema
+        self._validate_table(schema_name, table)
+
+        columns = self._describe_table_columns(schema_name, table)
+        schema = self._columns_to_schema(table_name, schema_name, columns)
+
+        requested_columns = self._parse_columns_option(table_options)
+        if requested_columns:
+            self._check_requested_columns(table_name, schema.fieldNames(), requested_columns)
+            schema = StructType([schema[name] for name in requested_columns])
+        return schema
+
+    def _parse_columns_option(self, table_options: Dict[str, str]) -> Optional[List[str]]:
+        """Parse the comma-separated 'columns' table option into a list of names."""
+        columns = table_options.get("columns", "")
+        return [c.strip() for c in columns.split(",") if c.strip()] or None
+
+    def _check_requested_columns(
+        self, table_name: str, known_columns: List[str], requested_columns: List[str]
+    ) -> None:
+        """
+        Raise ValueError if any requested column is not a column of the table.
+        
+        Requested names are interpolated into the SELECT list, so they are only
+        accepted if they match the table's columns exactly.
+        """
+        known_column_set = set(known_columns)
+        unknown_columns = [c for c in requested_columns if c not in known_column_set]
+        if unknown_columns:
             raise ValueError(
-                f"Table '{full_table_name}' is not supported. "
-                f"Available tables: {', '.join(available_tables[:10])}..."
-                if len(available_tables) > 10
-                else f"Available tables: {', '.join(available_tables)}"
+                f"Unknown columns for table '{table_name}': {', '.join(unknown_columns)}"
             )
 
-        sql = f"""
-            SELECT 
-                column_name,
-                data_type,
-                is_nullable,
-                character_maximum_length,
-                numeric_precision,
-                numeric_scale,
-                ordinal_position
-            FROM information_schema.columns
-            WHERE table_schema = '{schema_name}'
-                AND table_name = '{table}'
-            ORDER BY ordinal_position
+    def _columns_to_schema(
+        self, table_name: str, schema_name: str, columns: List[Dict[str, Any]]
+    ) -> StructType:
         """
-
-        records = self._execute_and_fetch(sql)
-
-        if not records:
+        Convert DescribeTable column metadata into a Spark schema.
+        
+        Args:
+            table_name: Table name as requested (for error messages)
+            schema_name: Schema containing the table
+            columns: ColumnList entries from DescribeTable
+            
+        Returns:
+            StructType representing the table schema
+        """
+        if not columns:
             raise ValueError(
                 f"Table '{table_name}' not found or has no columns in schema '{schema_name}'"
             )
 
         fields = []
-        for record in records:
-            col_name = self._extract_value(record[0])
-            data_type = self._extract_value(record[1])
-            is_nullable_str = self._extract_value(record[2])
-            char_max_length = self._extract_value(record[3])
-            numeric_precision = self._extract_value(record[4])
-            numeric_scale = self._extract_value(record[5])
-
-            # Convert is_nullable from 'YES'/'NO' to boolean
-            is_nullable = is_nullable_str == "YES" if is_nullable_str else True
+        for column in columns:
+            # nullable is 0 (no nulls), 1 (nullable) or 2 (unknown)
+            is_nullable = column.get("nullable", 1) != 0
 
             # Map Redshift type to Spark type
-            spark_type = self._map_redshift_type_to_spark(
-                data_type, numeric_precision, numeric_scale, char_max_length
+            spark_type = _map_redshift_type_to_spark(
+                column["typeName"],
+                column.get("precision"),
+                column.get("scale"),
+                column.get("length"),
             )
 
-            fields.append(StructField(col_name, spark_type, is_nullable))
+            fields.append(StructField(column["name"], spark_type, is_nullable))
 
         return StructType(fields)
 
+    async def get_many_table_schemas_async(
+        self, table_names: List[str]
+    ) -> Dict[str, StructType]:
+        """
+        Fetch the schemas of several tables concurrently on the event loop.
+        
+        Async counterpart of get_many_table_schemas for callers already running
+        an event loop: DescribeTable calls are multiplexed on one thread through
+        an aioboto3 client instead of a thread per table. Requires the optional
+        aioboto3 package.
+        
+        Args:
+            table_names: Table names in format "schema.table" or just "table"
+            
+        Returns:
+            Dictionary mapping each requested table name to its StructType
+        """
+        try:
+            import aioboto3  # Optional dependency, only needed for async discovery
+        except ImportError as e:
+            raise ImportError(
+                "get_many_table_schemas_async requires the 'aioboto3' package"
+            ) from e
+
+        # One listing validates every requested table against the same rule
+        # as list_tables, off the event loop thread
+        listed_tables = set(await asyncio.to_thread(self.list_tables))
+        for table_name in table_names:
+            schema_name, table = self._parse_table_name(table_name)
+            if f"{schema_name}.{table}" not in listed_tables:
+                raise ValueError(
+                    f"Table '{schema_name}.{table}' is not supported or does not exist"
+                )
+
+        semaphore = asyncio.Semaphore(_MAX_ASYNC_CONCURRENCY)
+        session = aioboto3.Session()
+
+        async with session.client(
+            "redshift-data", config=_client_config(), **self._client_kwargs
+        ) as client:
+
+            async def fetch_schema(table_name: str) -> StructType:
+                schema_name, table = self._parse_table_name(table_name)
+                async with semaphore:
+                    columns = await self._describe_table_columns_async(
+                        client, schema_name, table
+                    )
+                return self._columns_to_schema(table_name, schema_name, columns)
+
+            schemas = await asyncio.gather(*(fetch_schema(name) for name in table_names))
+
+        return dict(zip(table_names, schemas))
+
+    async def _describe_table_columns_async(
+        self, client: Any, schema_name: str, table: str
+    ) -> List[Dict[str, Any]]:
+        """
+        Async variant of _describe_table_columns using an aioboto3 client.
+        
+        Args:
+            client: aioboto3 redshift-data client
+            schema_name: Schema containing the table
+            table: Table name
+            
+        Returns:
+            List of column metadata dicts
+        """
+        params = self._describe_table_params(schema_name, table)
+        columns = []
+        with self._describe_table_errors():
+            while params:
+                response = await client.describe_table(**params)
+                params = self._add_column_page(params, response, columns)
+        return columns
+
+    def get_many_table_schemas(self, table_names: List[str]) -> Dict[str, StructType]:
+        """
+        Fetch the schemas of several tables concurrently.
+        
+        Each get_table_schema call is dominated by Data API round-trips, so the
+        fetches are fanned out over a thread pool sharing the same boto3 client.
+        
+        Args:
+            table_names: Table names in format "schema.table" or just "table"
+            
+        Returns:
+            Dictionary mapping each requested table name to its StructType
+        """
+        # Initialize the client once, before fanning out, so the workers don't
+        # race to create it
+        _ = self.client
+
+        with ThreadPoolExecutor(max_workers=_MAX_WORKERS) as executor:
+            futures = {
+                name: executor.submit(self.get_table_schema, name, {})
+                for name in table_names
+            }
+            return {name: future.result() for name, future in futures.items()}
+
     def read_table_metadata(
         self, table_name: str, table_options: Dict[str, str]
     ) -> Dict[str, Any]:
@@ -499,37 +1221,10 @@ class LakeflowConnect:
                 - primary_keys: List of primary key column names
                 - ingestion_type: "snapshot" (Redshift Data API does not support CDC)
         """
-        # Parse table name first to get fully-qualified name
         schema_name, table = self._parse_table_name(table_name)
-        full_table_name = f"{schema_name}.{table}"
         
-        # Validate table exists using fully-qualified name
-        available_tables = self.list_tables()
-        if full_table_name not in available_tables:
-            raise ValueError(
-                f"Table '{full_table_name}' is not supported. "
-                f"Available tables: {', '.join(available_tables[:10])}..."
-                if len(available_tables) > 10
-                else f"Available tables: {', '.join(available_tables)}"
-            )
-
-        # Query for primary key constraints
-        sql = f"""
-            SELECT 
-                kcu.column_name,
-                kcu.ordinal_position
-            FROM information_schema.table_constraints tc
-            JOIN information_schema.key_column_usage kcu
-                ON tc.constraint_name = kcu.constraint_name
-                AND tc.table_schema = kcu.table_schema
-                AND tc.table_name = kcu.table_name
-            WHERE tc.constraint_type = 'PRIMARY KEY'
-                AND tc.table_schema = '{schema_name}'
-                AND tc.table_name = '{table}'
-            ORDER BY kcu.ordinal_position
-        """
-
-        records = self._execute_and_fetch(sql)
+        # Validate table exists and fetch primary key constraints
+        records = self._fetch_primary_key_records(schema_name, table)
 
         primary_keys = []
         for record in records:
@@ -555,12 +1250,18 @@ class LakeflowConnect:
         For Redshift, this performs a full table scan (snapshot ingestion).
         The start_offset is ignored since we do not support incremental reads via Data API.
         
+        When unload_s3_prefix and unload_iam_role are configured, reads without a
+        limit are exported with UNLOAD to Parquet on S3 and read back from there;
+        otherwise results are paged through the Data API.
+        
         Args:
             table_name: Table name in format "schema.table" or just "table"
             start_offset: Ignored (snapshot ingestion only)
             table_options: Additional options:
                 - limit: Optional row limit for testing (default: no limit)
-                - where_clause: Optional WHERE clause to filter rows (future enhancement)
+                - where_clause: Optional WHERE clause to filter rows
+                - columns: Optional comma-separated column subset to select
+                  (default: all columns)
                 
         Returns:
             Tuple of (iterator of records as dicts, final offset dict)
@@ -568,23 +1269,27 @@ class LakeflowConnect:
         """
         from botocore.exceptions import ClientError  # Import here to avoid serialization issues
         
-        # Parse table name first to get fully-qualified name
         schema_name, table = self._parse_table_name(table_name)
-        full_table_name = f"{schema_name}.{table}"
         
-        # Validate table exists using fully-qualified name
-        available_tables = self.list_tables()
-        if full_table_name not in available_tables:
-            raise ValueError(
-                f"Table '{full_table_name}' is not supported. "
-                f"Available tables: {', '.join(available_tables[:10])}..."
-                if len(available_tables) > 10
-                else f"Available tables: {', '.join(available_tables)}"
+        # Validate table exists with a single-table probe
+        self._validate_table(schema_name, table)
+
+        requested_columns = self._parse_columns_option(table_options)
+        if requested_columns:
+            # Requested columns are checked against the table's columns
+            columns = self._describe_table_columns(schema_name, table)
+            self._check_requested_columns(
+                table_name, [col["name"] for col in columns], requested_columns
+            )
+            select_list = ", ".join(
+                '"' + name.replace('"', '""') + '"' for name in requested_columns
             )
+        else:
+            select_list = "*"
         full_table_name = f'"{schema_name}"."{table}"'
 
-        # Build SQL query
-        sql = f"SELECT * FROM {full_table_name}"
+        # Build SQL query, pushing the projection down to Redshift
+        sql = f"SELECT {select_list} FROM {full_table_name}"
 
         # Add optional WHERE clause (table option)
         where_clause = table_options.get("where_clause")
@@ -600,48 +1305,60 @@ class LakeflowConnect:
             except ValueError:
                 pass  # Ignore invalid limit
 
+        # Bulk reads go through UNLOAD; limited (test) reads stay on the Data API
+        if self.unload_s3_prefix and not limit:
+            return self._read_via_unload(sql), {}
+
         # Execute query
         statement_id = self._execute_sql(sql)
         self._wait_for_statement(statement_id)
 
-        # Get column metadata from the statement description
+        # Fetch the first page, which also carries the column metadata
         try:
-            result_response = self.client.get_statement_result(Id=statement_id)
-            column_metadata = result_response.get("ColumnMetadata", [])
-            column_names = [col["name"] for col in column_metadata]
+            first_response = self.client.get_statement_result(Id=statement_id)
+            column_metadata = first_response.get("ColumnMetadata", [])
         except ClientError as e:
-            raise RuntimeError(f"Failed to get column metadata: {e}") from e
+            raise RuntimeError(f"Failed to get statement results: {e}") from e
+
+        # Resolve column names and per-column value extractors once, rather than
+        # dispatching on the typed value keys for every cell
+        column_names = tuple(col["name"] for col in column_metadata)
+        extractors = tuple(self._make_extractor(col.get("typeName", "")) for col in column_metadata)
 
-        # Generator to yield records with pagination
+        # Generator to yield records with pagination. The first page is reused;
+        # the remaining pages are fetched by a background thread so the next
+        # request overlaps with row processing.
         def record_generator() -> Iterator[dict]:
-            next_token = None
-            
-            while True:
-                params = {"Id": statement_id}
-                if next_token:
-                    params["NextToken"] = next_token
+            pages = queue.Queue(maxsize=_PREFETCH_PAGES)
+            stop = threading.Event()
+            next_token = first_response.get("NextToken")
+            if next_token:
+                producer = threading.Thread(
+                    target=self._prefetch_result_pages,
+                    args=(statement_id, next_token, pages, stop),
+                    daemon=True,
+                )
+                producer.start()
+            else:
+                pages.put(None)
 
-                try:
-                    response = self.client.get_statement_result(**params)
-                except ClientError as e:
-                    raise RuntimeError(f"Failed to get statement results: {e}") from e
+            page = first_response.get("Records", [])
+            try:
+                while page is not None:
+                    if isinstance(page, Exception):
+                        raise page
 
-                records = response.get("Records", [])
-                
-                for record in records:
-                    # Convert record (list of field values) to dictionary
-                    record_dict = {}
-                    for idx, field_data in enumerate(record):
-                        if idx < len(column_names):
-                            col_name = column_names[idx]
-                            value = self._extract_value(field_data)
-                            record_dict[col_name] = value
-                    
-                    yield record_dict
+                    for record in page:
+                        # Convert record (list of field values) to dictionary
+                        yield {
+                            name: extract(field_data)
+                            for name, extract, field_data in zip(column_names, extractors, record)
+                        }
 
-                next_token = response.get("NextToken")
-                if not next_token:
-                    break
+                    page = pages.get()
+            finally:
+                # Release the producer if the consumer stops early
+                stop.set()
 
         # Return iterator and empty offset (snapshot ingestion)
         return record_generator(), {}
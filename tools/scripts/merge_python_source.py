@@ -77,7 +77,13 @@ def extract_imports_and_code(content: str) -> tuple:
         # code, docstrings are kept as-is.
         if stripped.startswith('"""') or stripped.startswith("'''"):
             if in_imports:
-                # Skip leading module docstring lines entirely
+                # Skip the leading module docstring entirely, including the
+                # body and closing line of a multi-line docstring
+                quote = stripped[:3]
+                if stripped.count(quote) < 2:
+                    i += 1
+                    while i < len(lines) and quote not in lines[i]:
+                        i += 1
                 i += 1
                 continue
             else: